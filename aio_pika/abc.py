@@ -362,7 +362,7 @@ class AbstractQueue:
 class AbstractQueueIterator(AsyncIterable):
     _amqp_queue: AbstractQueue
     _queue: asyncio.Queue
-    _consumer_tag: ConsumerTag
+    _consumer_tag: Optional[ConsumerTag]
     _consume_kwargs: Dict[str, Any]
 
     @abstractmethod
@@ -506,10 +506,14 @@ class AbstractChannel(PoolInstance, ABC):
 
     close_callbacks: CallbackCollection
     return_callbacks: CallbackCollection
-    default_exchange: AbstractExchange
 
     publisher_confirms: bool
 
+    @property
+    @abstractmethod
+    def default_exchange(self) -> AbstractExchange:
+        raise NotImplementedError
+
     @property
     @abstractmethod
     def is_initialized(self) -> bool:
@@ -520,6 +524,15 @@ class AbstractChannel(PoolInstance, ABC):
     def is_closed(self) -> bool:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def is_safe_to_reuse(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reset_for_reuse(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def close(self, exc: Optional[ExceptionType] = None) -> Awaitable[None]:
         raise NotImplementedError
@@ -589,6 +602,12 @@ class AbstractChannel(PoolInstance, ABC):
     ) -> AbstractQueue:
         raise NotImplementedError
 
+    @abstractmethod
+    async def declare_temp_queue(
+        self, *, timeout: TimeoutType = None,
+    ) -> AbstractQueue:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_queue(
         self, name: str, *, ensure: bool = True,
@@ -627,6 +646,35 @@ class AbstractChannel(PoolInstance, ABC):
     ) -> aiormq.spec.Exchange.DeleteOk:
         raise NotImplementedError
 
+    @abstractmethod
+    async def publish(
+        self,
+        message: AbstractMessage,
+        routing_key: str,
+        *,
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: TimeoutType = None,
+    ) -> Optional[aiormq.abc.ConfirmationFrameType]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def publish_nowait(
+        self,
+        message: AbstractMessage,
+        routing_key: str,
+        *,
+        exchange: ExchangeParamType = "",
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: TimeoutType = None,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def wait_for_confirms(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def transaction(self) -> AbstractTransaction:
         raise NotImplementedError
@@ -2,7 +2,9 @@ import asyncio
 import warnings
 from abc import ABC
 from types import TracebackType
-from typing import Any, AsyncContextManager, Generator, Optional, Type, Union
+from typing import (
+    Any, AsyncContextManager, Generator, List, Optional, Type, Union,
+)
 from warnings import warn
 
 import aiormq
@@ -10,10 +12,11 @@ import aiormq.abc
 from pamqp.common import Arguments
 
 from .abc import (
-    AbstractChannel, AbstractConnection, AbstractExchange, AbstractQueue,
-    TimeoutType, UnderlayChannel,
+    AbstractChannel, AbstractConnection, AbstractExchange, AbstractMessage,
+    AbstractQueue, ExchangeParamType, TimeoutType, UnderlayChannel,
+    get_exchange_name,
 )
-from .exceptions import ChannelInvalidStateError
+from .exceptions import ChannelInvalidStateError, PublisherConfirmsError
 from .exchange import Exchange, ExchangeType
 from .log import get_logger
 from .message import IncomingMessage
@@ -82,6 +85,8 @@ class Channel(ChannelContext):
 
         self._channel: Optional[UnderlayChannel] = None
         self._channel_number = channel_number
+        self._default_exchange: Optional[Exchange] = None
+        self._initializing: Optional[asyncio.Future] = None
 
         self.close_callbacks = CallbackCollection(self)
         self.return_callbacks = CallbackCollection(self)
@@ -89,6 +94,13 @@ class Channel(ChannelContext):
         self.publisher_confirms = publisher_confirms
         self.on_return_raises = on_return_raises
 
+        # Publications made by publish_nowait() since the last flush
+        self._unconfirmed: List[asyncio.Future] = []
+
+        # QoS settings stick to the channel and leak to the next
+        # user of the pooled channel
+        self._qos_mutated: bool = False
+
     @property
     def is_initialized(self) -> bool:
         """Returns True when the channel has been opened
@@ -99,10 +111,8 @@ class Channel(ChannelContext):
     def is_closed(self) -> bool:
         """Returns True when the channel has been closed from the broker
         side or after the close() method has been called."""
-        if not self.is_initialized or self._closed:
-            return True
         channel = self._channel
-        if channel is None:
+        if channel is None or self._closed:
             return True
         return channel.channel.is_closed
 
@@ -110,26 +120,23 @@ class Channel(ChannelContext):
         self,
         exc: Optional[aiormq.abc.ExceptionType] = None,
     ) -> None:
-        if not self.is_initialized:
+        channel = self._channel
+        if channel is None:
             log.warning("Channel not opened")
             return
 
-        if not self._channel:
-            log.warning("Transport is not ready")
-            return
-
         log.debug("Closing channel %r", self)
         self._closed = True
-        await self._channel.close()
+        await channel.close()
 
     async def get_underlay_channel(self) -> aiormq.abc.AbstractChannel:
-
-        if not self.is_initialized or not self._channel:
+        channel = self._channel
+        if channel is None:
             raise aiormq.exceptions.ChannelInvalidStateError(
                 "Channel was not opened",
             )
 
-        return self._channel.channel
+        return channel.channel
 
     @property
     def channel(self) -> aiormq.abc.AbstractChannel:
@@ -141,19 +148,60 @@ class Channel(ChannelContext):
             raise aiormq.exceptions.ChannelInvalidStateError
         return self._channel.channel
 
+    @property
+    def is_safe_to_reuse(self) -> bool:
+        """Returns True when the channel can be handed to another user
+        (e.g. by a channel pool) as is: it is open, has no active consumers
+        and its QoS was never changed."""
+        channel = self._channel
+        if channel is None or self._closed or self._qos_mutated:
+            return False
+        underlay_channel = channel.channel
+        if underlay_channel.is_closed:
+            return False
+        # Deliveries for active consumers would reach the next user
+        return not underlay_channel.consumers     # type: ignore
+
+    async def reset_for_reuse(self) -> None:
+        """ Prepare the channel to be handed to another user without
+        reopening it. Waits for pending :meth:`publish_nowait`
+        confirmations, logs their errors instead of raising them to the
+        next user, and drops the return callbacks of the previous user.
+
+        Close callbacks are kept: besides user callbacks they hold the
+        channel's own ones (e.g. the restore callback of
+        :class:`aio_pika.RobustChannel`) and the callbacks of the queues
+        declared on this channel.
+
+        :raises: :class:`RuntimeError` when the channel
+            is not :attr:`is_safe_to_reuse`
+        """
+
+        if not self.is_safe_to_reuse:
+            raise RuntimeError(f"Channel {self!r} is not safe to reuse")
+
+        try:
+            await self.wait_for_confirms()
+        except PublisherConfirmsError as e:
+            log.warning(
+                "Dropping unconfirmed publications of %r: %r", self, e,
+            )
+        finally:
+            self.return_callbacks.clear()
+
     @property
     def number(self) -> Optional[int]:
-        if self._channel is None:
+        channel = self._channel
+        if channel is None:
             return self._channel_number
-
-        underlay_channel: UnderlayChannel = self._channel
-        return underlay_channel.channel.number
+        return channel.channel.number
 
     def __str__(self) -> str:
         return "{}".format(self.number or "Not initialized channel")
 
     async def _open(self) -> None:
-        await self._connection.ready()
+        if not self._connection.connected.is_set():
+            await self._connection.ready()
 
         transport = self._connection.transport
         if transport is None:
@@ -177,41 +225,87 @@ class Channel(ChannelContext):
         self._closed = False
 
     async def initialize(self, timeout: TimeoutType = None) -> None:
+        # Checked first: _channel is already set while _on_open()
+        # and _on_initialized() of the first call are still running
+        initializing = self._initializing
+        while initializing is not None:
+            # Concurrent call, just wait for the first one to finish
+            await asyncio.shield(initializing)
+            if self.is_initialized:
+                return
+            # The first call was cancelled, so open the channel here
+            initializing = self._initializing
+
         if self.is_initialized:
             raise RuntimeError("Already initialized")
         elif self._closed:
             raise RuntimeError("Can't initialize closed channel")
 
-        await self._open()
-        await self._on_initialized()
+        initializing = asyncio.get_event_loop().create_future()
+        self._initializing = initializing
+
+        try:
+            await self._open()
+            await self._on_initialized()
+        except asyncio.CancelledError as e:
+            # Joined callers were not cancelled, let them retry instead
+            try:
+                channel = self._channel
+                if channel is not None:
+                    await channel.close(e)
+            finally:
+                self._channel = None
+                initializing.set_result(None)
+            raise
+        except BaseException as e:
+            initializing.set_exception(e)
+            # Mark it as retrieved when there are no concurrent waiters
+            initializing.exception()
+            raise
+        else:
+            initializing.set_result(None)
+        finally:
+            self._initializing = None
 
     async def _on_open(self) -> None:
-        self.default_exchange: Exchange = self.EXCHANGE_CLASS(
-            channel=self,
-            arguments=None,
-            auto_delete=False,
-            durable=False,
-            internal=False,
-            name="",
-            passive=False,
-            type=ExchangeType.DIRECT,
-        )
+        pass
+
+    @property
+    def default_exchange(self) -> Exchange:
+        exchange = self._default_exchange
+        if exchange is None:
+            exchange = self._default_exchange = self.EXCHANGE_CLASS(
+                channel=self,
+                arguments=None,
+                auto_delete=False,
+                durable=False,
+                internal=False,
+                name="",
+                passive=False,
+                type=ExchangeType.DIRECT,
+            )
+        return exchange
 
     async def _on_close(self, closing: asyncio.Future) -> None:
         try:
             exc = closing.exception()
         except asyncio.CancelledError as e:
             exc = e
-        await self.close_callbacks(exc)
 
-        if self._channel and self._channel.channel:
-            self._channel.channel.on_return_callbacks.discard(self._on_return)
+        if self.close_callbacks:
+            await self.close_callbacks(exc)
+
+        channel = self._channel
+        if channel and channel.channel:
+            channel.channel.on_return_callbacks.discard(self._on_return)
 
     async def _on_initialized(self) -> None:
         channel = await self.get_underlay_channel()
         channel.on_return_callbacks.add(self._on_return)
 
     def _on_return(self, message: aiormq.abc.DeliveredMessage) -> None:
+        if not self.return_callbacks:
+            return
         self.return_callbacks(IncomingMessage(message, no_ack=True))
 
     async def reopen(self) -> None:
@@ -351,6 +445,23 @@ class Channel(ChannelContext):
         self.close_callbacks.add(queue.close_callbacks, weak=True)
         return queue
 
+    async def declare_temp_queue(
+        self, *, timeout: TimeoutType = None,
+    ) -> AbstractQueue:
+        """
+        Declare an anonymous exclusive queue which is deleted when the
+        last consumer unsubscribes or the connection closes, e.g.
+        for RPC replies. Shortcut for
+        ``.declare_queue(exclusive=True, auto_delete=True)``.
+
+        :param timeout: execution timeout
+        :return: :class:`aio_pika.queue.Queue` instance
+        """
+
+        return await self.declare_queue(
+            exclusive=True, auto_delete=True, timeout=timeout,
+        )
+
     async def get_queue(
         self, name: str, *, ensure: bool = True,
     ) -> AbstractQueue:
@@ -397,6 +508,7 @@ class Channel(ChannelContext):
             global_ = all_channels
 
         channel = await self.get_underlay_channel()
+        self._qos_mutated = True
 
         return await channel.basic_qos(
             prefetch_count=prefetch_count,
@@ -437,6 +549,130 @@ class Channel(ChannelContext):
             timeout=timeout,
         )
 
+    async def publish(
+        self,
+        message: AbstractMessage,
+        routing_key: str,
+        *,
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: TimeoutType = None,
+    ) -> Optional[aiormq.abc.ConfirmationFrameType]:
+        """ Publish the message through the default exchange.
+
+        Same as ``channel.default_exchange.publish(...)`` but sends the
+        message straight to the underlay channel.
+
+        :param message: message instance
+        :param routing_key: routing key, the queue name for the
+            default exchange
+        :param mandatory: return the message when it can not be routed
+        :param immediate: request immediate delivery
+        :param timeout: execution timeout
+        :return: confirmation frame when publisher confirms are enabled
+        """
+
+        return await self.__publish(
+            message, routing_key, "", mandatory, immediate, timeout,
+        )
+
+    async def __publish(
+        self,
+        message: AbstractMessage,
+        routing_key: str,
+        exchange: ExchangeParamType,
+        mandatory: bool,
+        immediate: bool,
+        timeout: TimeoutType,
+        wait: bool = True,
+    ) -> Optional[aiormq.abc.ConfirmationFrameType]:
+        channel = await self.get_underlay_channel()
+        # "wait" is supported by aiormq.Channel but missing in its ABC
+        return await channel.basic_publish(     # type: ignore
+            exchange=get_exchange_name(exchange),
+            routing_key=routing_key,
+            body=message.body,
+            properties=message.properties,
+            mandatory=mandatory,
+            immediate=immediate,
+            timeout=timeout,
+            wait=wait,
+        )
+
+    def publish_nowait(
+        self,
+        message: AbstractMessage,
+        routing_key: str,
+        *,
+        exchange: ExchangeParamType = "",
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: TimeoutType = None,
+    ) -> None:
+        """ Publish the message without waiting for the broker confirmation.
+
+        Confirmations and errors of all messages published this way are
+        collected by :meth:`wait_for_confirms`, which must be called to
+        flush them. The frames are queued for writing without waiting for
+        the socket drain.
+
+        This is a convenience over gathering ``publish`` tasks yourself,
+        not a cheaper publish: each message is still published in its own
+        task and confirmed through its own aiormq future.
+
+        .. code-block:: python
+
+            for body in bodies:
+                channel.publish_nowait(Message(body), routing_key="queue")
+
+            await channel.wait_for_confirms()
+
+        :param message: message instance
+        :param routing_key: routing key
+        :param exchange: exchange instance or name,
+            the default exchange when omitted
+        :param mandatory: return the message when it can not be routed
+        :param immediate: request immediate delivery
+        :param timeout: publish and confirmation timeout
+        """
+
+        if not self.publisher_confirms:
+            raise RuntimeError(
+                '"publish_nowait" not applicable '
+                'without "publisher_confirms"',
+            )
+
+        self._unconfirmed.append(
+            asyncio.ensure_future(
+                self.__publish(
+                    message, routing_key, exchange,
+                    mandatory, immediate, timeout, wait=False,
+                ),
+            ),
+        )
+
+    async def wait_for_confirms(self) -> None:
+        """ Wait until all messages published by :meth:`publish_nowait`
+        since the previous call are confirmed by the broker.
+
+        :raises: :class:`aio_pika.exceptions.PublisherConfirmsError` which
+            contains the errors (e.g. nack'ed deliveries) of each failed
+            publication
+        """
+
+        unconfirmed, self._unconfirmed = self._unconfirmed, []
+
+        if not unconfirmed:
+            return
+
+        results = await asyncio.gather(*unconfirmed, return_exceptions=True)
+        errors = [
+            result for result in results if isinstance(result, BaseException)
+        ]
+
+        if errors:
+            raise PublisherConfirmsError(errors)
+
     def transaction(self) -> Transaction:
         if self.publisher_confirms:
             raise RuntimeError(
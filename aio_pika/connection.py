@@ -129,7 +129,8 @@ class Connection(AbstractConnection):
                 channel42 = connection.channel(42)
                 await channel42.close()
 
-                # For working with transactions
+                # For working with transactions or
+                # the fastest fire-and-forget publishing
                 channel_no_confirms = await connection.channel(
                     publisher_confirms=False
                 )
@@ -156,7 +157,9 @@ class Connection(AbstractConnection):
             if `True` the :func:`aio_pika.Exchange.publish` method will be
             return :class:`bool` after publish is complete. Otherwise the
             :func:`aio_pika.Exchange.publish` method will be return
-            :class:`None`
+            :class:`None`. Without confirms no confirmation future is
+            created and awaited per message, which suits fire-and-forget
+            workloads like log shipping or metrics.
         :param on_return_raises:
             raise an :class:`aio_pika.exceptions.DeliveryError`
             when mandatory message will be returned
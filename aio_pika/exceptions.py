@@ -1,4 +1,5 @@
 import asyncio
+from typing import Sequence
 
 import pamqp.exceptions
 from aiormq.exceptions import (
@@ -29,6 +30,14 @@ class QueueEmpty(AMQPError, asyncio.QueueEmpty):
     pass
 
 
+class PublisherConfirmsError(AMQPError):
+    reason = "%d published messages were not confirmed: %r"
+
+    def __init__(self, errors: Sequence[BaseException]):
+        self.errors = tuple(errors)
+        super().__init__(len(self.errors), self.errors)
+
+
 __all__ = (
     "AMQPChannelError",
     "AMQPConnectionError",
@@ -50,5 +59,6 @@ __all__ = (
     "ProbableAuthenticationError",
     "ProtocolSyntaxError",
     "PublishError",
+    "PublisherConfirmsError",
     "QueueEmpty",
 )
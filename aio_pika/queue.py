@@ -16,7 +16,7 @@ from .exceptions import QueueEmpty
 from .exchange import ExchangeParamType
 from .log import get_logger
 from .message import IncomingMessage
-from .tools import CallbackCollection, create_task, ensure_awaitable
+from .tools import CallbackCollection, ensure_awaitable
 
 
 if sys.version_info >= (3, 8):
@@ -34,7 +34,9 @@ async def consumer(
     no_ack: bool,
 ) -> Any:
     message = IncomingMessage(msg, no_ack=no_ack)
-    return await create_task(callback, message)
+    # aiormq already runs every delivery in its own task and the callback
+    # is always wrapped by ensure_awaitable, so await it in place
+    return await callback(message)
 
 
 class Queue(AbstractQueue):
@@ -405,12 +407,12 @@ class QueueIterator(AbstractQueueIterator):
 
     @property
     def consumer_tag(self) -> Optional[ConsumerTag]:
-        return getattr(self, "_consumer_tag", None)
+        return self._consumer_tag
 
     async def close(self, *_: Any) -> Any:
         log.debug("Cancelling queue iterator %r", self)
 
-        if not hasattr(self, "_consumer_tag"):
+        if self._consumer_tag is None:
             log.debug("Queue iterator %r already cancelled", self)
             return
 
@@ -420,7 +422,7 @@ class QueueIterator(AbstractQueueIterator):
 
         log.debug("Basic.cancel for %r", self.consumer_tag)
         consumer_tag = self._consumer_tag
-        del self._consumer_tag
+        self._consumer_tag = None
 
         self._amqp_queue.close_callbacks.remove(self.close)
         await self._amqp_queue.cancel(consumer_tag)
@@ -465,7 +467,7 @@ class QueueIterator(AbstractQueueIterator):
         )
 
     def __init__(self, queue: Queue, **kwargs: Any):
-        self._consumer_tag: ConsumerTag
+        self._consumer_tag: Optional[ConsumerTag] = None
         self._amqp_queue: AbstractQueue = queue
         self._queue = asyncio.Queue()
         self._consume_kwargs = kwargs
@@ -484,7 +486,7 @@ class QueueIterator(AbstractQueueIterator):
         return self
 
     async def __aenter__(self) -> "AbstractQueueIterator":
-        if not hasattr(self, "_consumer_tag"):
+        if self._consumer_tag is None:
             await self.consume()
         return self
 
@@ -497,7 +499,7 @@ class QueueIterator(AbstractQueueIterator):
         await self.close()
 
     async def __anext__(self) -> IncomingMessage:
-        if not hasattr(self, "_consumer_tag"):
+        if self._consumer_tag is None:
             await self.consume()
         try:
             return await asyncio.wait_for(
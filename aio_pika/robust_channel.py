@@ -34,7 +34,6 @@ class RobustChannel(Channel, AbstractRobustChannel):    # type: ignore
 
     _exchanges: DefaultDict[str, MutableSet[AbstractRobustExchange]]
     _queues: DefaultDict[str, MutableSet[RobustQueue]]
-    default_exchange: RobustExchange
 
     def __init__(
         self,
@@ -76,8 +75,13 @@ class RobustChannel(Channel, AbstractRobustChannel):    # type: ignore
         while not self.__restored:
             await self.__ready.wait()
 
+    @property
+    def default_exchange(self) -> RobustExchange:
+        return super().default_exchange     # type: ignore
+
     async def get_underlay_channel(self) -> aiormq.abc.AbstractChannel:
-        await self._connection.ready()
+        if not self._connection.connected.is_set():
+            await self._connection.ready()
         return await super().get_underlay_channel()
 
     async def restore(self, channel: Any = None) -> None:
@@ -117,8 +121,7 @@ class RobustChannel(Channel, AbstractRobustChannel):    # type: ignore
         await self.reopen_callbacks()
 
     async def _on_open(self) -> None:
-        if not hasattr(self, "default_exchange"):
-            await super()._on_open()
+        await super()._on_open()
 
         exchanges = tuple(chain(*self._exchanges.values()))
         queues = tuple(chain(*self._queues.values()))
@@ -135,9 +138,6 @@ class RobustChannel(Channel, AbstractRobustChannel):    # type: ignore
         for queue in queues:
             await queue.restore()
 
-        if hasattr(self, "default_exchange"):
-            self.default_exchange.channel = self
-
         self.__ready.set()
 
     async def set_qos(
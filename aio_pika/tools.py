@@ -191,6 +191,9 @@ class CallbackCollection(MutableSet):
         return instance
 
     def __call__(self, *args: Any, **kwargs: Any) -> Awaitable[Any]:
+        if not self:
+            return STUB_AWAITABLE
+
         futures: List[asyncio.Future] = []
 
         with self.__lock:
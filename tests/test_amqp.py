@@ -91,6 +91,80 @@ class TestCaseAmqp(TestCaseAmqpBase):
         await channel.reopen()
         assert not channel.is_closed
 
+    async def test_channel_concurrent_initialize(self, connection):
+        channel = self.create_channel(connection)
+
+        await asyncio.gather(*[channel.initialize() for _ in range(5)])
+        assert not channel.is_closed
+
+        with pytest.raises(RuntimeError):
+            await channel.initialize()
+
+        await channel.close()
+
+    async def test_channel_initialize_while_opening(self, connection):
+        channel = self.create_channel(connection)
+        assert isinstance(channel, Channel)
+
+        opened = asyncio.Event()
+        on_initialized = channel._on_initialized
+
+        async def slow_on_initialized():
+            opened.set()
+            await asyncio.sleep(0.1)
+            await on_initialized()
+
+        with mock.patch.object(
+            channel, "_on_initialized", slow_on_initialized,
+        ):
+            first = asyncio.ensure_future(channel.initialize())
+            await opened.wait()
+
+            # The underlay channel is already set, but initialization
+            # is not finished yet, so this call must join the first one
+            assert channel.is_initialized
+            await channel.initialize()
+
+            await first
+
+        assert not channel.is_closed
+
+        await channel.close()
+
+    async def test_channel_initialize_cancelled(self, connection):
+        channel = self.create_channel(connection)
+        assert isinstance(channel, Channel)
+
+        opened = asyncio.Event()
+        on_initialized = channel._on_initialized
+
+        async def stuck_on_initialized():
+            if not opened.is_set():
+                opened.set()
+                await asyncio.Event().wait()
+            await on_initialized()
+
+        with mock.patch.object(
+            channel, "_on_initialized", stuck_on_initialized,
+        ):
+            first = asyncio.ensure_future(channel.initialize())
+            await opened.wait()
+
+            joined = asyncio.ensure_future(channel.initialize())
+            await asyncio.sleep(0)
+
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+            # The joined call was not cancelled and opens the channel again
+            await joined
+
+        assert channel.is_initialized
+        assert not channel.is_closed
+
+        await channel.close()
+
     async def test_delete_queue_and_exchange(
         self, connection, declare_exchange, declare_queue,
     ):
@@ -124,6 +198,24 @@ class TestCaseAmqp(TestCaseAmqpBase):
 
         await channel.queue_delete(queue.name)
 
+    async def test_declare_temp_queue(self, connection):
+        channel = await self.create_channel(connection)
+        queue = await channel.declare_temp_queue()
+
+        assert queue.name
+        assert queue.exclusive
+        assert queue.auto_delete
+
+        body = os.urandom(32)
+
+        await channel.publish(Message(body=body), routing_key=queue.name)
+
+        message = await queue.get(timeout=5)
+        assert message.body == body
+        await message.ack()
+
+        await channel.close()
+
     @pytest.mark.skip(reason="This was deprecated in AMQP 0-9-1")
     async def test_internal_exchange(
         self, channel: aio_pika.Channel, declare_exchange, declare_queue,
@@ -268,6 +360,43 @@ class TestCaseAmqp(TestCaseAmqpBase):
 
         await queue.unbind(exchange, routing_key)
 
+    async def test_channel_publish(
+        self,
+        channel: aio_pika.Channel,
+        declare_queue: Callable,
+    ):
+        queue = await declare_queue(
+            get_random_name("test_channel_publish"),
+            auto_delete=True, channel=channel,
+        )
+
+        body = bytes(shortuuid.uuid(), "utf-8")
+
+        result = await channel.publish(
+            Message(body, content_type="text/plain", headers={"foo": "bar"}),
+            queue.name,
+        )
+
+        if channel.publisher_confirms:
+            assert result
+        else:
+            assert result is None
+
+        incoming_message = await queue.get(timeout=5)
+        await incoming_message.ack()
+
+        assert incoming_message.body == body
+        assert incoming_message.headers == {"foo": "bar"}
+
+    async def test_default_exchange(self, channel: aio_pika.Channel):
+        assert channel._default_exchange is None
+
+        exchange = channel.default_exchange
+        assert exchange is channel.default_exchange
+        assert isinstance(exchange, aio_pika.Exchange)
+        assert exchange.name == ""
+        assert exchange.channel is channel
+
     async def test_simple_publish_and_receive_delivery_mode_explicitly(
         self,
         channel: aio_pika.Channel,
@@ -883,6 +1012,38 @@ class TestCaseAmqp(TestCaseAmqpBase):
         with pytest.deprecated_call():
             await channel.set_qos(prefetch_count=1, all_channels=True)
 
+    async def test_channel_safe_to_reuse(
+        self, connection: aio_pika.Connection, declare_queue: Callable,
+    ):
+        channel = await self.create_channel(connection)
+        assert channel.is_safe_to_reuse
+
+        queue = await declare_queue(
+            get_random_name("test_channel_safe_to_reuse"),
+            auto_delete=True, channel=channel,
+        )
+        channel.return_callbacks.add(lambda *_: None)
+        await channel.reset_for_reuse()
+        assert not channel.return_callbacks
+
+        consumer_tag = await queue.consume(lambda message: None)
+        assert not channel.is_safe_to_reuse
+
+        with pytest.raises(RuntimeError):
+            await channel.reset_for_reuse()
+
+        await queue.cancel(consumer_tag)
+        assert channel.is_safe_to_reuse
+
+        await channel.set_qos(prefetch_count=1)
+        assert not channel.is_safe_to_reuse
+
+        await channel.close()
+
+        channel = await self.create_channel(connection)
+        await channel.close()
+        assert not channel.is_safe_to_reuse
+
     async def test_exchange_delete(
         self, channel: aio_pika.Channel, declare_exchange,
     ):
@@ -1675,3 +1836,75 @@ class TestCaseAmqpWithConfirms(TestCaseAmqpBase):
         returned = await f
 
         assert returned.body == body
+
+    async def test_publish_nowait(
+        self, connection: aio_pika.Connection, declare_queue: Callable,
+    ):
+        channel = await self.create_channel(connection)
+        queue = await declare_queue(
+            get_random_name("test_publish_nowait"),
+            auto_delete=True, channel=channel,
+        )
+
+        for i in range(10):
+            channel.publish_nowait(Message(b"%d" % i), queue.name)
+
+        assert len(channel._unconfirmed) == 10
+        await channel.wait_for_confirms()
+        assert not channel._unconfirmed
+
+        for i in range(10):
+            incoming_message = await queue.get(timeout=5)
+            await incoming_message.ack()
+            assert incoming_message.body == b"%d" % i
+
+        # Nothing to wait for
+        await channel.wait_for_confirms()
+
+    async def test_publish_nowait_errors(
+        self, connection: aio_pika.Connection,
+    ):
+        channel = await connection.channel(on_return_raises=True)
+
+        for _ in range(3):
+            channel.publish_nowait(
+                Message(b"returned"),
+                get_random_name("test_publish_nowait_errors"),
+            )
+
+        with pytest.raises(
+            aio_pika.exceptions.PublisherConfirmsError,
+        ) as e:
+            await channel.wait_for_confirms()
+
+        assert len(e.value.errors) == 3
+        assert all(
+            isinstance(error, aio_pika.exceptions.PublishError)
+            for error in e.value.errors
+        )
+
+    async def test_reset_for_reuse_unconfirmed(
+        self, connection: aio_pika.Connection,
+    ):
+        channel = await connection.channel(on_return_raises=True)
+        channel.return_callbacks.add(lambda *_: None)
+
+        channel.publish_nowait(
+            Message(b"returned"),
+            get_random_name("test_reset_for_reuse_unconfirmed"),
+        )
+
+        await channel.reset_for_reuse()
+        assert not channel.return_callbacks
+
+        # Nothing of the previous user is left to report
+        await channel.wait_for_confirms()
+        await channel.close()
+
+    async def test_publish_nowait_without_confirms(
+        self, connection: aio_pika.Connection,
+    ):
+        channel = await connection.channel(publisher_confirms=False)
+
+        with pytest.raises(RuntimeError):
+            channel.publish_nowait(Message(b"body"), "routing_key")
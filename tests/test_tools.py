@@ -6,7 +6,9 @@ from unittest import mock
 
 import pytest
 
-from aio_pika.tools import CallbackCollection, ensure_awaitable
+from aio_pika.tools import (
+    STUB_AWAITABLE, CallbackCollection, ensure_awaitable,
+)
 
 
 log = logging.getLogger(__name__)
@@ -91,6 +93,9 @@ class TestCase:
     async def test_blank_awaitable_callback(self, collection):
         await collection()
 
+        # Empty collection does not schedule anything
+        assert collection() is STUB_AWAITABLE
+
     async def test_awaitable_callback(
         self, event_loop, collection, instance,
     ):